@@ -0,0 +1,8 @@
+"""Pytest configuration.
+
+Living at the repository root, this file makes pytest put the root on
+``sys.path`` so the tests can ``import main`` when pytest is run from the
+root or given its path. ``main`` locates its templates, static files and
+translations relative to its own file, so the working directory does not
+matter.
+"""
@@ -2,41 +2,352 @@
 Python Togo FastAPI application.
 
 This module defines a small FastAPI server that serves HTML templates,
-static assets, and a few JSON API endpoints for events, news, communities,
+static assets, and a few JSON API endpoints for events, news, translations,
 and basic forms (join, contact, partnership).
 
 Notes
 -----
-- Translations are stored in-memory in `TRANSLATIONS` and selected via
-    cookie or `Accept-Language`.
+- Translations are loaded from `i18n/<lang>.json` into `TRANSLATIONS`,
+    frozen into read-only mappings with interned keys, and selected via the
+    `lang` query parameter, cookie or `Accept-Language`.
 - Sample data for events and news is kept in-memory for simplicity.
 """
 
-from datetime import date
-import json
+import asyncio
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import functools
+import gc
+import gzip
+import hashlib
+import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
-from typing import List, Optional
-
-from dotenv import load_dotenv
-from email_validator import EmailNotValidError, validate_email
+from pathlib import Path
+from queue import SimpleQueue
+import re
+import sys
+import threading
+import time
+from types import MappingProxyType
+
+from email_validator import (
+    SPECIAL_USE_DOMAIN_NAMES,
+    EmailNotValidError,
+    validate_email,
+)
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from supabase import Client, create_client
+import httpx
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+from supabase import Client, ClientOptions, create_client
+
+# Outside production, settings may come from a local .env file; production
+# gets them from the real environment and does not need python-dotenv.
+if os.getenv("ENV") != "production":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+SUPABASE_URL = os.getenv("SUPABASE_URL")
+SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+DEV = os.getenv("DEV") == "1"
+QUEUE_INSERTS = os.getenv("QUEUE_INSERTS") == "1"
+
+log = logging.getLogger("python_togo")
+
+# Templates, static files and translations are located next to this module,
+# so the app works whatever the working directory.
+BASE_DIR = Path(__file__).parent
+
+# A single Jinja environment shared by all requests: templates are compiled
+# once per worker (bytecode is also persisted on disk for cold starts) and
+# never re-stat'ed. Set DEV=1 to pick up template edits without a restart.
+env = Environment(
+    loader=FileSystemLoader(BASE_DIR / "templates"),
+    autoescape=True,
+    auto_reload=DEV,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+templates = Jinja2Templates(env=env)
+
+# Short content hashes of the static files, appended to their URLs by the
+# ``static()`` template helper so browsers may keep them for a year. Left
+# empty under DEV=1 so edited assets show up without a restart.
+STATIC_DIR = BASE_DIR / "static"
+STATIC_VERSIONS = (
+    {}
+    if DEV
+    else {
+        path.relative_to(STATIC_DIR).as_posix(): hashlib.blake2b(
+            path.read_bytes(), digest_size=4
+        ).hexdigest()
+        for path in STATIC_DIR.rglob("*")
+        if path.is_file()
+    }
+)
+
+
+def static_url(path: str) -> str:
+    """
+    Build the URL of a static file, fingerprinted with its content hash.
+
+    Parameters
+    ----------
+    path : str
+        Path relative to the static directory, e.g. ``"css/style.css"``.
+
+    Returns
+    -------
+    str
+        ``/static/<path>?v=<hash>``, or the plain URL for unknown files.
+    """
+    version = STATIC_VERSIONS.get(path)
+    if version is None:
+        return f"/static/{path}"
+    return f"/static/{path}?v={version}"
+
+
+env.globals["static"] = static_url
 
-app = FastAPI(title="Python Togo")
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+
+    Stands in for ``fastapi.responses.ORJSONResponse``, which is deprecated
+    in recent FastAPI releases.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    Static files served from an in-memory LRU cache.
+
+    Files up to ``max_file_size`` bytes are read from disk on first request
+    and then answered from memory, skipping the per-request ``stat`` and
+    read. Every response carries a ``Cache-Control`` header so browsers and
+    proxies can reuse assets between pages; URLs fingerprinted with the
+    file's current version (``?v=<hash>``) are marked immutable.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of files kept in memory; 0 disables the cache.
+    max_file_size : int, optional
+        Larger files are always streamed from disk.
+    cache_control : str, optional
+        Value of the ``Cache-Control`` header added to responses.
+    versions : dict, optional
+        Content hash of each file path, as used in fingerprinted URLs.
+    immutable_cache_control : str, optional
+        ``Cache-Control`` value for fingerprinted URLs.
+    **kwargs
+        Forwarded to ``StaticFiles``.
+    """
+
+    _kept_headers = ("content-type", "etag", "last-modified")
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        max_file_size: int = 64 * 1024,
+        cache_control: str = "public, max-age=300",
+        versions: dict[str, str] | None = None,
+        immutable_cache_control: str = "public, max-age=31536000, immutable",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.max_file_size = max_file_size
+        self.cache_control = cache_control
+        self.versions = versions or {}
+        self.immutable_cache_control = immutable_cache_control
+        self._cache: OrderedDict[str, tuple[bytes, dict]] = OrderedDict()
+
+    def cache_control_for(self, path: str, scope) -> str:
+        version = self.versions.get(path)
+        if version and f"v={version}".encode() in scope["query_string"].split(b"&"):
+            return self.immutable_cache_control
+        return self.cache_control
+
+    async def get_response(self, path: str, scope) -> Response:
+        cached = self._cache.get(path)
+        if cached is None or scope["method"] not in ("GET", "HEAD"):
+            response = await super().get_response(path, scope)
+            response.headers["Cache-Control"] = self.cache_control_for(path, scope)
+            if (
+                self.max_entries
+                and isinstance(response, FileResponse)
+                and response.status_code == 200
+                and int(response.headers["content-length"]) <= self.max_file_size
+            ):
+                body = await asyncio.to_thread(Path(response.path).read_bytes)
+                headers = {key: response.headers[key] for key in self._kept_headers}
+                self._cache[path] = (body, headers)
+                if len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return response
+        self._cache.move_to_end(path)
+        body, headers = cached
+        headers = {**headers, "cache-control": self.cache_control_for(path, scope)}
+        if self.is_not_modified(Headers(headers), Headers(scope=scope)):
+            return NotModifiedResponse(Headers(headers))
+        return Response(content=body, headers=headers)
+
+
+def configure_logging() -> QueueListener | None:
+    """
+    Send log records through a queue to a stderr handler on its own thread.
+
+    Does nothing when the root logger is already configured (e.g. by the
+    server or tests).
+
+    Returns
+    -------
+    logging.handlers.QueueListener or None
+        The started listener, to be stopped on shutdown.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    queue = SimpleQueue()
+    listener = QueueListener(queue, logging.StreamHandler())
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(queue)])
+    # httpx logs every Supabase request at INFO.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    listener.start()
+    return listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: warm caches before serving the first request.
+
+    Parameters
+    ----------
+    app : fastapi.FastAPI
+        The application instance.
+    """
+    log_listener = configure_logging()
+    for name in env.list_templates(extensions=["html"]):
+        env.get_template(name)
+    render_fragments()
+    for table in REMOTE_TABLES:
+        schedule_refresh(table)
+    if QUEUE_INSERTS:
+        start_insert_worker()
+    year_ticker = asyncio.create_task(_year_ticker())
+    # Translations, sample data and compiled templates live for the whole
+    # process: move them out of the collector's generations so GC passes
+    # stop re-scanning them.
+    gc.freeze()
+    yield
+    year_ticker.cancel()
+    await stop_insert_worker()
+    if log_listener is not None:
+        log_listener.stop()
+
+
+app = FastAPI(
+    title="Python Togo",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=6)
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount(
+    "/static",
+    # Under DEV=1 files are read from disk on every request and browsers are
+    # told to revalidate them, so edits show up on the next reload.
+    CachedStaticFiles(
+        directory=STATIC_DIR,
+        versions=STATIC_VERSIONS,
+        max_entries=0 if DEV else 256,
+        cache_control="no-cache" if DEV else "public, max-age=300",
+    ),
+    name="static",
+)
 
-templates = Jinja2Templates(directory="templates")
-load_dotenv()
-SUBABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
-supabase: Client = create_client(SUBABASE_URL, SUPABASE_KEY)
+_supabase: Client | None = None
+_supabase_lock = threading.Lock()
+
+
+def get_supabase() -> Client:
+    """
+    Return the shared Supabase client, creating it on first use.
+
+    The client is backed by one ``httpx.Client`` with a small keep-alive
+    pool (sized well under Supabase's connection limits), so requests reuse
+    open TLS connections instead of performing a new handshake each time.
+    Creation is locked because the first calls may come from worker threads
+    concurrently.
+
+    Returns
+    -------
+    supabase.Client
+        The process-wide Supabase client.
+    """
+    global _supabase
+    if _supabase is None:
+        with _supabase_lock:
+            if _supabase is None:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10,
+                        max_connections=10,
+                        keepalive_expiry=30,
+                    ),
+                    timeout=5,
+                )
+                options = ClientOptions(
+                    postgrest_client_timeout=5,
+                    storage_client_timeout=5,
+                    httpx_client=http_client,
+                )
+                _supabase = create_client(SUPABASE_URL, SUPABASE_KEY, options=options)
+    return _supabase
+
+
+@dataclass(slots=True, frozen=True)
+class Event:
+    """A community event; ``translations`` maps language to title/description."""
+
+    id: int
+    date: str
+    location: str
+    translations: MappingProxyType
+
+
+@dataclass(slots=True, frozen=True)
+class NewsItem:
+    """A news item; ``translations`` maps language to title/excerpt/body."""
+
+    id: int
+    date: str
+    image: str | None
+    translations: MappingProxyType
+
 
 # Simple in-memory sample data
 SAMPLE_EVENTS = [
@@ -89,6 +400,10 @@ SAMPLE_EVENTS = [
     },
 ]
 
+# Keep events most recent first (by start date, some are ranges) so listings
+# need no per-request sort.
+SAMPLE_EVENTS.sort(key=lambda e: e["date"].split(" ", 1)[0], reverse=True)
+
 SAMPLE_NEWS = [
     {
         "id": 1,
@@ -165,621 +480,150 @@ SAMPLE_NEWS = [
 ]
 
 
+# UI strings live in one JSON file per language under i18n/.
+I18N_DIR = BASE_DIR / "i18n"
 TRANSLATIONS = {
-    "fr": {
-        "site-title": "Python Togo",
-        "nav-home": "The Python Software Community Togo",
-        "nav-about": "À propos",
-        "nav-code": "Code de conduite",
-        "nav-events": "Événements",
-        "nav-news": "Actualités",
-        "nav-gallery": "Galerie",
-        "nav-join": "Adhérer",
-        "nav-contact": "Contact",
-        "nav-partners": "Partenaires",
-        "nav-communities": "Communautés",
-        "lang-fr": "FR",
-        "lang-en": "EN",
-        "donate": "Faire un don",
-        "footer-about-title": "À propos",
-        "footer-about-desc": (
-            "Python Togo promeut le langage de programmation Python au Togo."
-        ),
-        "footer-links-title": "Liens",
-        "footer-contact-title": "Contact",
-        "footer-logo-by": "Logo conçu avec ❤️ par",
-        "footer-site-by": "Ce site a été conçu et développé avec ❤️ par",
-        "footer-using": "à l'aide de",
-        "footer-and-deployed": "et déployé sur",
-        "footer-rights": "Tous droits réservés.",
-        "footer-logos": "Logos",
-        "gallery-title": "Galerie",
-        "gallery-intro": (
-            "Découvrez les photos de nos événements et rencontres. Cliquez sur le "
-            "lien ci-dessous pour accéder à notre album."
-        ),
-        "gallery-view": "Voir",
-        "gallery-external": "Voir notre galerie",
-        "gallery-external-coming": "Voir notre galerie (à venir)",
-        "gallery-recent": "Vignettes récentes",
-        "join-title": "Adhérer",
-        "join-intro": (
-            "Rejoignez la communauté Python Togo en remplissant le formulaire "
-            "ci-dessous."
-        ),
-        "label-name": "Nom",
-        "label-fullname": "Nom complet",
-        "label-email": "Email",
-        "label-city": "Ville",
-        "label-level": "Niveau Python",
-        "level-beginner": "Débutant",
-        "level-intermediate": "Intermédiaire",
-        "level-advanced": "Avancé",
-        "btn-send": "Envoyer",
-        "contact-title": "Contact",
-        "contact-intro": (
-            "Pour toute question, envoyez-nous un message via le formulaire."
-        ),
-        "label-subject": "Sujet",
-        "label-message": "Message",
-        "agree-privacy": "J'ai lu et j'accepte la politique de confidentialité",
-        "agree-coc": "J'ai lu et j'accepte le Code de conduite",
-        "consent-alert": (
-            "Veuillez accepter la politique de confidentialité et le Code de "
-            "conduite avant de continuer."
-        ),
-        "privacy-link-text": "Politique de confidentialité",
-        "news-title": "Actualités",
-        "news-read-more": "Voir plus",
-        "news-back": "Retour aux actualités",
-        "privacy-title": "Politique de confidentialité",
-        "privacy-heading": "Politique de confidentialité",
-        "privacy-intro": (
-            "Chez Python Togo, nous prenons la confidentialité de vos données au "
-            "sérieux. Cette page explique quelles données nous collectons, "
-            "pourquoi nous les collectons et comment nous les utilisons."
-        ),
-        "privacy-collect-heading": "Données que nous collectons",
-        "privacy-collect-1": (
-            "Données de contact : nom, adresse e‑mail, téléphone (si fournies) "
-            "lorsque vous remplissez un formulaire."
-        ),
-        "privacy-collect-2": (
-            "Informations de profil : ville, niveau, intérêts (quand vous les "
-            "partagez)."
-        ),
-        "privacy-collect-3": (
-            "Données techniques : adresse IP, type de navigateur et timing des "
-            "requêtes pour améliorer nos services."
-        ),
-        "privacy-why-heading": "Pourquoi nous collectons ces données",
-        "privacy-why-intro": "Nous utilisons vos données pour :",
-        "privacy-why-1": "Répondre à vos demandes (adhésion, partenariat, contact).",
-        "privacy-why-2": "Organiser et informer sur les événements.",
-        "privacy-why-3": "Améliorer l'expérience et la sécurité du site.",
-        "privacy-share-heading": "Partage et conservation",
-        "privacy-share-text": (
-            "Nous ne vendons ni ne louons vos données personnelles. Les demandes "
-            "reçues peuvent être partagées avec les membres organisateurs et "
-            "conservées aussi longtemps que nécessaire pour répondre à la "
-            "demande ou se conformer aux obligations légales."
-        ),
-        "privacy-retention-sub": "Durée de conservation",
-        "privacy-retention-intro": (
-            "Nous conservons vos données aussi longtemps que nécessaire pour "
-            "atteindre les objectifs pour lesquels elles ont été collectées. "
-            "Par exemple :"
-        ),
-        "privacy-retention-1": (
-            "Demandes d'adhésion : conservées pendant 3 ans après la dernière "
-            "interaction, sauf si vous demandez leur suppression."
-        ),
-        "privacy-retention-2": (
-            "Inscriptions à des événements : conservées pendant la durée "
-            "nécessaire à l'organisation et archivées pendant 3 ans pour des "
-            "raisons administratives."
-        ),
-        "privacy-retention-3": (
-            "Messages de contact : conservés pendant 2 à 3 ans selon la nature "
-            "de la demande."
-        ),
-        "privacy-disclosure-sub": "Partage et divulgation",
-        "privacy-disclosure-text": (
-            "Nous ne partageons pas vos données personnelles avec des tiers à des "
-            "fins commerciales sans votre consentement explicite. Les données "
-            "peuvent être partagées avec des prestataires qui traitent les "
-            "données pour notre compte (hébergement, envoi d'emails), sous "
-            "contrat de confidentialité."
-        ),
-        "privacy-rights-heading": "Vos droits",
-        "privacy-rights-text": (
-            "Vous pouvez demander l'accès, la rectification ou la suppression de "
-            "vos données en nous contactant à"
-        ),
-        "privacy-forms-heading": "Formulaires et consentement",
-        "privacy-forms-intro": (
-            "Tous les formulaires importants (adhésion, partenariat) exigent votre "
-            "consentement explicite :"
-        ),
-        "privacy-forms-privacy": (
-            "Vous devez cocher la case indiquant que vous avez lu et accepté "
-            "notre politique de confidentialité."
-        ),
-        "privacy-forms-coc": (
-            "Vous devez cocher la case indiquant que vous acceptez le Code de "
-            "conduite de la communauté."
-        ),
-        "privacy-questions": (
-            "Si vous avez des questions sur cette politique, contactez-nous à"
-        ),
-        "coc-title": "Code de conduite",
-        "coc-heading": "Code de conduite",
-        "coc-intro": (
-            "Cette charte s'inspire des meilleures pratiques utilisées par les "
-            "communautés Python, notamment celles de la Python Software "
-            "Foundation (PSF). Elle vise à garantir un environnement sûr, "
-            "accueillant et professionnel pour toutes et tous, quelles que "
-            "soient l'expérience, l'identité ou l'origine."
-        ),
-        "coc-commitment": "Notre engagement",
-        "coc-commitment-intro": "Nous nous engageons à :",
-        "coc-commitment-1": (
-            "Fournir un espace inclusif et respectueux pour les événements, "
-            "forums et canaux en ligne liés à Python Togo."
-        ),
-        "coc-commitment-2": "Valoriser la diversité des parcours et des contributions.",
-        "coc-commitment-3": (
-            "Répondre rapidement et de manière confidentielle aux signalements "
-            "de comportements inappropriés."
-        ),
-        "coc-expected": "Comportements attendus",
-        "coc-expected-1": "Respecter les autres participants et leurs opinions.",
-        "coc-expected-2": (
-            "Être attentif(ve) au langage employé et utiliser un ton constructif."
-        ),
-        "coc-expected-3": (
-            "Accepter les retours avec humilité et être prêt(e) à s'excuser en "
-            "cas d'erreur."
-        ),
-        "coc-expected-4": (
-            "Respecter les règles spécifiques aux lieux ou aux plateformes "
-            "(modération, sécurité, accessibilité)."
-        ),
-        "coc-unacceptable": "Comportements inacceptables",
-        "coc-unacceptable-intro": "Ne seront pas tolérés :",
-        "coc-unacceptable-1": (
-            "Les propos discriminatoires, le harcèlement, les attaques "
-            "personnelles ou menaces."
-        ),
-        "coc-unacceptable-2": (
-            "La diffusion d'insultes, propos sexistes, racistes, homophobes, "
-            "transphobes ou tout autre contenu haineux."
-        ),
-        "coc-unacceptable-3": (
-            "Le partage non consenti d'informations personnelles ou confidentielles."
-        ),
-        "coc-unacceptable-4": (
-            "Le non-respect des consignes de sécurité et de modération des "
-            "organisateurs."
-        ),
-        "coc-scope": "Périmètre",
-        "coc-scope-text": (
-            "Ce code s'applique à tous les espaces officiels et événements "
-            "organisés par Python Togo, y compris les réunions en présentiel, "
-            "ateliers, conférences, listes de diffusion, forums et canaux de "
-            "discussion en ligne associés."
-        ),
-        "coc-report": "Procédure de signalement",
-        "coc-report-intro": (
-            "Si vous êtes victime ou témoin d'un comportement inacceptable :"
-        ),
-        "coc-report-1": (
-            "Contactez d'abord les organisateurs via la page de contact ou "
-            "envoyez un email à"
-        ),
-        "coc-report-2": (
-            "Fournissez autant de détails que possible : date, lieu, personnes "
-            "impliquées, témoins et copies de messages si pertinent."
-        ),
-        "coc-report-3": (
-            "Indiquez si vous souhaitez que votre signalement soit traité de "
-            "façon confidentielle."
-        ),
-        "coc-handling": "Gestion des signalements",
-        "coc-handling-text": (
-            "Les organisateurs examineront les signalements rapidement et "
-            "prendront des mesures proportionnées, qui peuvent inclure :"
-        ),
-        "coc-handling-1": "Un avertissement formel.",
-        "coc-handling-2": "La suspension ou exclusion d'un événement ou d'un canal.",
-        "coc-handling-3": (
-            "La communication d'informations aux autorités compétentes si nécessaire."
-        ),
-        "coc-confidentiality": "Confidentialité et protection",
-        "coc-confidentiality-text": (
-            "Les informations reçues dans le cadre d'un signalement seront "
-            "traitées avec la plus grande confidentialité possible. Seules les "
-            "personnes nécessaires à l'enquête auront accès aux informations."
-        ),
-        "coc-examples": "Exemples",
-        "coc-examples-intro": "Exemples de comportements à signaler :",
-        "coc-examples-1": (
-            "Messages répétés et non sollicités d'un individu visant une autre "
-            "personne."
-        ),
-        "coc-examples-2": (
-            "Commentaires à caractère discriminatoire sur la base d'une identité."
-        ),
-        "coc-examples-3": "Partage d'une photo privée sans consentement.",
-        "coc-organizers": "Responsabilités des organisateurs",
-        "coc-organizers-intro": "Les organisateurs s'engagent à :",
-        "coc-organizers-1": (
-            "Maintenir des procédures claires pour la gestion des incidents."
-        ),
-        "coc-organizers-2": (
-            "Former, si nécessaire, les modérateurs et responsables à la "
-            "gestion des signalements."
-        ),
-        "coc-organizers-3": (
-            "Publier des mises à jour sur les mesures prises, sans compromettre "
-            "la confidentialité."
-        ),
-        "coc-revision": "Révision",
-        "coc-revision-text": (
-            "Ce code de conduite pourra être revu périodiquement pour s'adapter "
-            "aux retours de la communauté et aux bonnes pratiques "
-            "internationales."
-        ),
-        "coc-thanks": (
-            "Merci de contribuer à faire de Python Togo un espace sûr et "
-            "accueillant pour tous."
-        ),
-        "home-title": "Accueil",
-        "home-welcome": "Bienvenue sur Python Togo",
-        "home-intro": (
-            "Python Togo est une communauté de développeurs et passionnés Python "
-            "au Togo. Nous organisons des événements, des formations et "
-            "promouvons l'usage de Python dans notre pays."
-        ),
-        "home-join": "Rejoindre la communauté",
-        "home-view-events": "Voir les événements",
-        "home-news-recent": "Actualités récentes",
-        "home-news-all": "Voir toutes les actualités",
-        "partners-our": "Nos partenaires",
-        "partners-intro": (
-            "Nous remercions les organisations et individus qui nous font confiance."
-        ),
-        "partners-none": "Aucun partenaire pour le moment.",
-        "partners-request-title": "Demander un partenariat",
-        "partners-request-intro": (
-            "Vous souhaitez nous soutenir ou devenir partenaire ? "
-            "Envoyez votre demande ci-dessous."
-        ),
-        "label-organization": "Organisation",
-        "label-contact-name": "Nom du contact",
-        "label-website-optional": "Site web (optionnel)",
-        "label-message-optional": "Message (optionnel)",
-        "partners-send": "Envoyer la demande",
-        "partners-sending": "Envoi en cours...",
-        "partners-success": "Demande envoyée, merci !",
-        "partners-error-prefix": "Erreur: ",
-        "partners-network-error-prefix": "Erreur réseau: ",
-        "about-title": "À propos",
-        "about-heading": "À propos",
-        "about-blurb": (
-            "Python Togo rassemble les développeurs, étudiants et professionnels "
-            "utilisant Python au Togo. Notre mission est de promouvoir "
-            "l'apprentissage et l'utilisation de Python."
-        ),
-        "about-mission": "Notre mission",
-        "about-m1": "Promouvoir l'apprentissage et l'utilisation de Python",
-        "about-m2": "Organiser des événements et formations",
-        "about-m3": "Favoriser le partage de connaissances",
-        "events-title": "Événements",
-        "events-heading": "Événements",
-        "events-sample-meta": "2025-12-05 • Lomé",
-        "events-sample-title": "Atelier Python débutant",
-        "events-sample-desc": "Introduction à Python pour les nouveaux développeurs.",
-        "communities-title": "Communautés",
-        "communities-heading": "Communautés locales",
-        "communities-card-title": "Python Togo",
-        "communities-card-desc": (
-            "Groupe local basé à Lomé, rencontre mensuelle et ateliers."
-        ),
-    },
-    "en": {
-        "site-title": "Python Togo",
-        "nav-home": "Home",
-        "nav-about": "About",
-        "nav-code": "Code of Conduct",
-        "nav-events": "Events",
-        "nav-news": "News",
-        "nav-gallery": "Gallery",
-        "nav-join": "Join",
-        "nav-contact": "Contact",
-        "nav-partners": "Partners",
-        "nav-communities": "Communities",
-        "lang-fr": "FR",
-        "lang-en": "EN",
-        "donate": "Donate",
-        "footer-about-title": "About",
-        "footer-about-desc": (
-            "Python Togo promotes the Python programming language in Togo."
-        ),
-        "footer-links-title": "Links",
-        "footer-contact-title": "Contact",
-        "footer-logo-by": "Logo designed with ❤️ by",
-        "footer-site-by": "This site was designed and developed with ❤️ by",
-        "footer-using": "using",
-        "footer-and-deployed": "and deployed on",
-        "footer-rights": "All rights reserved.",
-        "footer-logos": "Logos",
-        "gallery-title": "Gallery",
-        "gallery-intro": (
-            "Discover photos from our events and meetups. Use the link below "
-            "to access our album."
-        ),
-        "gallery-view": "View",
-        "gallery-external": "View our gallery",
-        "gallery-external-coming": "View our gallery (coming soon)",
-        "gallery-recent": "Recent thumbnails",
-        "join-title": "Join",
-        "join-intro": ("Join the Python Togo community by filling out the form below."),
-        "label-name": "Name",
-        "label-fullname": "Full name",
-        "label-email": "Email",
-        "label-city": "City",
-        "label-level": "Python level",
-        "level-beginner": "Beginner",
-        "level-intermediate": "Intermediate",
-        "level-advanced": "Advanced",
-        "btn-send": "Send",
-        "contact-title": "Contact",
-        "contact-intro": ("For any questions, send us a message using the form."),
-        "label-subject": "Subject",
-        "label-message": "Message",
-        "agree-privacy": "I have read and agree to the privacy policy",
-        "agree-coc": "I have read and agree to the Code of Conduct",
-        "consent-alert": (
-            "Please accept the privacy policy and Code of Conduct before continuing."
-        ),
-        "privacy-link-text": "Privacy Policy",
-        "news-title": "News",
-        "news-read-more": "Read more",
-        "news-back": "Back to news",
-        "privacy-title": "Privacy Policy",
-        "privacy-heading": "Privacy Policy",
-        "privacy-intro": (
-            "At Python Togo, we take your data privacy seriously. This page "
-            "explains what data we collect, why we collect it, and how we use "
-            "it."
-        ),
-        "privacy-collect-heading": "Data we collect",
-        "privacy-collect-1": (
-            "Contact data: name, email address, phone (if provided) when you "
-            "fill out a form."
-        ),
-        "privacy-collect-2": (
-            "Profile information: city, level, interests (when you share them)."
-        ),
-        "privacy-collect-3": (
-            "Technical data: IP address, browser type, and request timing to "
-            "improve our services."
-        ),
-        "privacy-why-heading": "Why we collect this data",
-        "privacy-why-intro": "We use your data to:",
-        "privacy-why-1": "Respond to your requests (membership, partnership, contact).",
-        "privacy-why-2": "Organize and inform about events.",
-        "privacy-why-3": "Improve the site experience and security.",
-        "privacy-share-heading": "Sharing and retention",
-        "privacy-share-text": (
-            "We do not sell or rent your personal data. Requests we receive "
-            "may be shared with organizing members and kept as long as "
-            "necessary to respond or comply with legal obligations."
-        ),
-        "privacy-retention-sub": "Retention period",
-        "privacy-retention-intro": (
-            "We retain your data as long as necessary to achieve the purposes "
-            "for which it was collected. For example:"
-        ),
-        "privacy-retention-1": (
-            "Membership requests: kept for 3 years after the last interaction, "
-            "unless you request deletion."
-        ),
-        "privacy-retention-2": (
-            "Event registrations: kept for the time needed to organize and "
-            "archived for 3 years for administrative reasons."
-        ),
-        "privacy-retention-3": (
-            "Contact messages: kept for 2–3 years depending on the nature of "
-            "the request."
-        ),
-        "privacy-disclosure-sub": "Sharing and disclosure",
-        "privacy-disclosure-text": (
-            "We do not share your personal data with third parties for "
-            "commercial purposes without your explicit consent. Data may be "
-            "shared with providers processing data on our behalf (hosting, "
-            "email delivery) under confidentiality agreements."
-        ),
-        "privacy-rights-heading": "Your rights",
-        "privacy-rights-text": (
-            "You can request access, rectification, or deletion of your data "
-            "by emailing"
-        ),
-        "privacy-forms-heading": "Forms and consent",
-        "privacy-forms-intro": (
-            "All key forms (membership, partnership) require your explicit consent:"
-        ),
-        "privacy-forms-privacy": (
-            "You must check the box indicating you have read and accepted our "
-            "privacy policy."
-        ),
-        "privacy-forms-coc": (
-            "You must check the box indicating you accept the community's Code "
-            "of Conduct."
-        ),
-        "privacy-questions": ("If you have questions about this policy, contact us at"),
-        "coc-title": "Code of Conduct",
-        "coc-heading": "Code of Conduct",
-        "coc-intro": (
-            "This charter draws on best practices used by Python communities, "
-            "including the Python Software Foundation (PSF). It aims to ensure "
-            "a safe, welcoming, and professional environment for everyone, "
-            "regardless of experience, identity, or background."
-        ),
-        "coc-commitment": "Our commitment",
-        "coc-commitment-intro": "We commit to:",
-        "coc-commitment-1": (
-            "Provide an inclusive and respectful space for events, forums, and "
-            "online channels related to Python Togo."
-        ),
-        "coc-commitment-2": "Value diverse backgrounds and contributions.",
-        "coc-commitment-3": (
-            "Respond quickly and confidentially to reports of inappropriate behavior."
-        ),
-        "coc-expected": "Expected behavior",
-        "coc-expected-1": "Respect other participants and their opinions.",
-        "coc-expected-2": ("Be mindful of language and use a constructive tone."),
-        "coc-expected-3": (
-            "Accept feedback humbly and be willing to apologize when wrong."
-        ),
-        "coc-expected-4": (
-            "Respect venue- or platform-specific rules (moderation, safety, "
-            "accessibility)."
-        ),
-        "coc-unacceptable": "Unacceptable behavior",
-        "coc-unacceptable-intro": "The following will not be tolerated:",
-        "coc-unacceptable-1": (
-            "Discriminatory remarks, harassment, personal attacks, or threats."
-        ),
-        "coc-unacceptable-2": (
-            "Insults; sexist, racist, homophobic, or transphobic remarks; or "
-            "any hateful content."
-        ),
-        "coc-unacceptable-3": (
-            "Sharing personal or confidential information without consent."
-        ),
-        "coc-unacceptable-4": (
-            "Failing to follow safety and moderation guidelines from organizers."
-        ),
-        "coc-scope": "Scope",
-        "coc-scope-text": (
-            "This code applies to all official spaces and events organized by "
-            "Python Togo, including in-person meetings, workshops, "
-            "conferences, mailing lists, forums, and associated online "
-            "channels."
-        ),
-        "coc-report": "Reporting procedure",
-        "coc-report-intro": (
-            "If you are a victim or witness of unacceptable behavior:"
-        ),
-        "coc-report-1": ("First, contact the organizers via the contact page or email"),
-        "coc-report-2": (
-            "Provide as many details as possible: date, location, people "
-            "involved, witnesses, and message copies if relevant."
-        ),
-        "coc-report-3": (
-            "Indicate if you wish your report to be handled confidentially."
-        ),
-        "coc-handling": "Handling reports",
-        "coc-handling-text": (
-            "Organizers will review reports promptly and take proportionate "
-            "measures, which may include:"
-        ),
-        "coc-handling-1": "A formal warning.",
-        "coc-handling-2": "Suspension or exclusion from an event or channel.",
-        "coc-handling-3": ("Informing authorities if necessary."),
-        "coc-confidentiality": "Confidentiality and protection",
-        "coc-confidentiality-text": (
-            "Information received in connection with a report will be handled "
-            "with the greatest possible confidentiality. Only people "
-            "necessary for the investigation will have access."
-        ),
-        "coc-examples": "Examples",
-        "coc-examples-intro": "Examples of behaviors to report:",
-        "coc-examples-1": (
-            "Repeated, unsolicited messages from one individual targeting "
-            "another person."
-        ),
-        "coc-examples-2": "Discriminatory comments based on identity.",
-        "coc-examples-3": "Sharing a private photo without consent.",
-        "coc-organizers": "Organizers' responsibilities",
-        "coc-organizers-intro": "Organizers commit to:",
-        "coc-organizers-1": ("Maintain clear procedures for incident handling."),
-        "coc-organizers-2": (
-            "Train moderators and leads, if needed, on handling reports."
-        ),
-        "coc-organizers-3": (
-            "Publish updates on actions taken without compromising confidentiality."
-        ),
-        "coc-revision": "Revision",
-        "coc-revision-text": (
-            "This code of conduct may be reviewed periodically to reflect "
-            "community feedback and international best practices."
-        ),
-        "coc-thanks": (
-            "Thank you for helping make Python Togo a safe and welcoming space for all."
-        ),
-        "home-title": "Home",
-        "home-welcome": "Welcome to Python Togo",
-        "home-intro": (
-            "Python Togo is a community of Python developers and enthusiasts in "
-            "Togo. We organize events, trainings, and promote the use of "
-            "Python across the country."
-        ),
-        "home-join": "Join the community",
-        "home-view-events": "View events",
-        "home-news-recent": "Recent news",
-        "home-news-all": "See all news",
-        "partners-our": "Our partners",
-        "partners-intro": (
-            "We thank the organizations and individuals who support us."
-        ),
-        "partners-none": "No partners yet.",
-        "partners-request-title": "Request a partnership",
-        "partners-request-intro": (
-            "Would you like to support us or become a partner? Send your request below."
-        ),
-        "label-organization": "Organization",
-        "label-contact-name": "Contact name",
-        "label-website-optional": "Website (optional)",
-        "label-message-optional": "Message (optional)",
-        "partners-send": "Send request",
-        "partners-sending": "Sending...",
-        "partners-success": "Request sent, thank you!",
-        "partners-error-prefix": "Error: ",
-        "partners-network-error-prefix": "Network error: ",
-        "about-title": "About",
-        "about-heading": "About",
-        "about-blurb": (
-            "Python Togo brings together developers, students, and "
-            "professionals using Python in Togo. Our mission is to promote "
-            "learning and use of Python."
-        ),
-        "about-mission": "Our mission",
-        "about-m1": "Promote learning and use of Python",
-        "about-m2": "Organize events and training",
-        "about-m3": "Encourage knowledge sharing",
-        "events-title": "Events",
-        "events-heading": "Events",
-        "events-sample-meta": "2025-12-05 • Lomé",
-        "events-sample-title": "Beginner Python workshop",
-        "events-sample-desc": "Introduction to Python for new developers.",
-        "communities-title": "Communities",
-        "communities-heading": "Local communities",
-        "communities-card-title": "Python Togo",
-        "communities-card-desc": (
-            "Local group based in Lomé, monthly meetups and workshops."
-        ),
-    },
+    lang: orjson.loads((I18N_DIR / f"{lang}.json").read_bytes())
+    for lang in ("fr", "en")
 }
 DONATE_URL = "https://www.paypal.com/donate/?hosted_button_id=A6547S7YGMZ4A"
 
 
+def freeze(value):
+    """
+    Recursively convert data to read-only containers.
+
+    Parameters
+    ----------
+    value : object
+        A dict, list or scalar.
+
+    Returns
+    -------
+    object
+        Dicts become ``MappingProxyType`` with interned string keys, lists
+        become tuples; other values are returned unchanged.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {
+                sys.intern(k) if isinstance(k, str) else k: freeze(v)
+                for k, v in value.items()
+            }
+        )
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+# Sample data and translations are shared by every request and never
+# modified, so make them immutable.
+SAMPLE_EVENTS = tuple(Event(**freeze(e)) for e in SAMPLE_EVENTS)
+SAMPLE_NEWS = tuple(NewsItem(**freeze(n)) for n in SAMPLE_NEWS)
+TRANSLATIONS = freeze(TRANSLATIONS)
+
+
+def _event_view(event: Event, lang: str) -> dict:
+    tr = event.translations.get(lang, {})
+    return {
+        "id": event.id,
+        "date": event.date,
+        "location": event.location,
+        "title": tr.get("title", ""),
+        "description": tr.get("description", ""),
+    }
+
+
+def _news_card(item: NewsItem, lang: str) -> dict:
+    tr = item.translations.get(lang, {})
+    return {
+        "id": item.id,
+        "date": item.date,
+        "title": tr.get("title", ""),
+        "excerpt": tr.get("excerpt", ""),
+        "image": item.image or f"https://picsum.photos/seed/news-{item.id}/600/340",
+    }
+
+
+def _news_page(item: NewsItem, lang: str) -> dict:
+    tr = item.translations.get(lang, {})
+    return {
+        "id": item.id,
+        "date": item.date,
+        "title": tr.get("title", ""),
+        "body": tr.get("body", ""),
+        "image": item.image or f"https://picsum.photos/seed/news-{item.id}/1200/680",
+    }
+
+
+# Per-language view models used by the templates, built once since the
+# sample data never changes. Listings are most recent first.
+EVENTS_BY_LANG = {
+    lang: freeze([_event_view(e, lang) for e in SAMPLE_EVENTS]) for lang in TRANSLATIONS
+}
+NEWS_BY_LANG = {
+    lang: freeze(
+        sorted(
+            (_news_card(n, lang) for n in SAMPLE_NEWS),
+            key=lambda n: n["date"],
+            reverse=True,
+        )
+    )
+    for lang in TRANSLATIONS
+}
+EVENTS_BY_ID_LANG = {
+    (event["id"], lang): event
+    for lang, events in EVENTS_BY_LANG.items()
+    for event in events
+}
+HOME_NEWS_BY_LANG = {lang: news[:2] for lang, news in NEWS_BY_LANG.items()}
+NEWS_BY_ID_LANG = {
+    (n.id, lang): freeze(_news_page(n, lang))
+    for n in SAMPLE_NEWS
+    for lang in TRANSLATIONS
+}
+
+
+def content_digest(body: bytes) -> str:
+    """Return a short hex digest of a response body, used to build ETags."""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def json_payload(data) -> tuple[bytes, str]:
+    """
+    Serialize static data for the JSON API.
+
+    Parameters
+    ----------
+    data : object
+        JSON-compatible data (frozen mappings are accepted).
+
+    Returns
+    -------
+    tuple of (bytes, str)
+        The JSON body and its quoted ETag.
+    """
+    body = orjson.dumps(data, default=dict)
+    return body, f'"{content_digest(body)}"'
+
+
+# The JSON API serves static data: serialize it once at import time.
+_EVENTS_JSON = json_payload(SAMPLE_EVENTS)
+_NEWS_JSON = json_payload(SAMPLE_NEWS)
+_TRANSLATIONS_JSON = {lang: json_payload(t) for lang, t in TRANSLATIONS.items()}
+API_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=86400"
+
+# First Accept-Language entry whose tag starts with a supported language.
+ACCEPT_LANGUAGE_RE = re.compile(r"(?:^|,)\s*(fr|en)", re.IGNORECASE)
+
+
 def get_language(request: Request) -> str:
     """
     Determine the preferred language for the request.
 
+    The result is memoized on ``request.state``, so repeated calls while
+    handling one request are free.
+
     Parameters
     ----------
     request : fastapi.Request
@@ -790,6 +634,13 @@ def get_language(request: Request) -> str:
     str
         The language code ("fr" or "en"). Defaults to "fr" if none matched.
     """
+    lang = getattr(request.state, "lang", None)
+    if lang is None:
+        lang = request.state.lang = _resolve_language(request)
+    return lang
+
+
+def _resolve_language(request: Request) -> str:
     # 1) Query param takes precedence for SEO-friendly alternate URLs
     query_lang = request.query_params.get("lang") or request.query_params.get("hl")
     if query_lang in TRANSLATIONS:
@@ -798,16 +649,17 @@ def get_language(request: Request) -> str:
     cookie_lang = request.cookies.get("lang")
     if cookie_lang in TRANSLATIONS:
         return cookie_lang
-    # Fallback to Accept-Language
-    accept = request.headers.get("accept-language", "")
-    if accept:
-        for part in accept.split(","):
-            code = part.split(";")[0].strip().lower()
-            if code.startswith("fr"):
-                return "fr"
-            if code.startswith("en"):
-                return "en"
-    return "fr"
+    # 3) Accept-Language, scanned in a single regex pass
+    match = ACCEPT_LANGUAGE_RE.search(request.headers.get("accept-language", ""))
+    return match.group(1).lower() if match else "fr"
+
+
+# The language preference cookie is kept for a year and readable from JS.
+LANG_COOKIE_OPTIONS = {
+    "max_age": 60 * 60 * 24 * 365,
+    "httponly": False,
+    "samesite": "lax",
+}
 
 
 @app.get("/lang/{lang_code}")
@@ -825,19 +677,67 @@ async def set_language(lang_code: str, request: Request):
     Returns
     -------
     fastapi.responses.RedirectResponse
-        Redirects to the referer while setting the `lang` cookie.
+        Redirects to the referer, setting the `lang` cookie if it differs.
     """
     if lang_code not in TRANSLATIONS:
         raise HTTPException(status_code=404, detail="Language not supported")
     referer = request.headers.get("referer") or "/"
     resp = RedirectResponse(url=referer, status_code=307)
-    resp.set_cookie(
-        "lang", lang_code, max_age=60 * 60 * 24 * 365, httponly=False, samesite="lax"
-    )
+    # Only send Set-Cookie when the preference actually changes.
+    if request.cookies.get("lang") != lang_code:
+        resp.set_cookie("lang", lang_code, **LANG_COOKIE_OPTIONS)
     return resp
 
 
-def ctx(request: Request, extra: Optional[dict] = None) -> dict:
+# Translation keys of the meta title and description of each page.
+PAGE_META = {
+    "home": ("home-title", "footer-about-desc"),
+    "about": ("about-title", "about-blurb"),
+    "events": ("events-title", "events-sample-desc"),
+    "news": ("news-title", "footer-about-desc"),
+    "partners": ("nav-partners", "partners-intro"),
+    "communities": ("nav-communities", "communities-card-desc"),
+    "join": ("join-title", "join-intro"),
+    "contact": ("contact-title", "contact-intro"),
+    "code-of-conduct": ("coc-title", "coc-intro"),
+    "privacy": ("privacy-title", "privacy-intro"),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def page_context(page: str | None, lang: str) -> MappingProxyType:
+    """
+    Build the request-independent part of a page's template context.
+
+    Parameters
+    ----------
+    page : str or None
+        Key in ``PAGE_META``, or None for pages without their own meta tags.
+    lang : str
+        Language code.
+
+    Returns
+    -------
+    types.MappingProxyType
+        Read-only context with year, language, translations and, for known
+        pages, the meta title and description. Cached per ``(page, lang)``.
+    """
+    t = TRANSLATIONS[lang]
+    context = {
+        "current_year": current_year,
+        "lang": lang,
+        "t": t,
+        "donate_url": DONATE_URL,
+        "fragments": RENDERED_FRAGMENTS.get(lang),
+    }
+    if page is not None:
+        title_key, description_key = PAGE_META[page]
+        context["meta_title"] = t[title_key] + " — Python Togo"
+        context["meta_description"] = t[description_key]
+    return MappingProxyType(context)
+
+
+def ctx(request: Request, extra: dict | None = None, page: str | None = None) -> dict:
     """
     Build the template context dictionary.
 
@@ -847,54 +747,290 @@ def ctx(request: Request, extra: Optional[dict] = None) -> dict:
         The incoming request used to derive language and cookies.
     extra : dict, optional
         Additional context values to merge.
+    page : str, optional
+        Key in ``PAGE_META`` whose meta title and description to include.
 
     Returns
     -------
     dict
         The context including year, language, translations, and extras.
     """
-    lang = get_language(request)
-    base = {
-        "current_year": current_year,
-        "lang": lang,
-        "t": TRANSLATIONS.get(lang, {}),
-        "donate_url": DONATE_URL,
-    }
+    base = dict(page_context(page, get_language(request)))
     if extra:
         base.update(extra)
     return base
 
 
-current_year = date.today().strftime("%Y")
-# Configurable donate URL (set DONATE_URL env var). Defaults to '#'.
+current_year = date.today().year
+
+
+async def _year_ticker() -> None:
+    # Wake up shortly after each midnight; on New Year, re-render everything
+    # that embeds the year (fragments first, as page contexts reference them).
+    global current_year
+    while True:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        await asyncio.sleep((midnight - now).total_seconds() + 1)
+        year = date.today().year
+        if year != current_year:
+            current_year = year
+            render_fragments()
+            page_context.cache_clear()
+            STATIC_HTML.clear()
+
+
+# The site header and footer only depend on the language, so they are
+# rendered once per locale and spliced into every page by ``base.html``.
+# Under DEV=1 nothing is pre-rendered and ``base.html`` includes the partials,
+# so edits to them show up on the next request.
+RENDERED_FRAGMENTS: dict = {}
+
+
+def render_fragments() -> None:
+    """Pre-render the header and footer partials for every language."""
+    if DEV:
+        return
+    for lang, t in TRANSLATIONS.items():
+        context = {
+            "current_year": current_year,
+            "lang": lang,
+            "t": t,
+            "donate_url": DONATE_URL,
+        }
+        RENDERED_FRAGMENTS[lang] = {
+            name: env.get_template(f"partials/{name}.html").render(context)
+            for name in ("header", "footer")
+        }
+
+
+# Pages whose HTML only depends on the language (and on the remote tables,
+# whose refresh clears this cache) are rendered once and served from memory.
+# The templates embed absolute URLs, so scheme and host are part of the key;
+# least recently used pages are evicted past the size bound, so arbitrary
+# Host headers cannot crowd out the real ones. Disabled under DEV=1.
+STATIC_HTML: OrderedDict = OrderedDict()
+STATIC_HTML_MAX_ENTRIES = 256
+# Shared caches may keep cached pages for a few minutes: they never carry a
+# Set-Cookie header and vary on everything that selects the language. Under
+# DEV=1 browsers revalidate them on every load.
+PAGE_CACHE_CONTROL = "no-cache" if DEV else "public, max-age=300"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's ``If-None-Match`` header matches an ETag.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request.
+    etag : str
+        The quoted ETag of the current representation.
+
+    Returns
+    -------
+    bool
+        True if the client already holds this representation.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*") for tag in header.split(",")
+    )
+
+
+# Indentation and blank lines, except inside elements where whitespace is
+# significant.
+_HTML_WHITESPACE_RE = re.compile(
+    rb"(<(pre|textarea)\b.*?</\2>)|\n\s+", re.DOTALL | re.IGNORECASE
+)
 
 
-class JoinRequest(BaseModel):
+def minify_html(body: bytes) -> bytes:
+    """
+    Strip indentation and blank lines from rendered HTML.
+
+    Line breaks are kept, so inline scripts relying on them stay valid, and
+    ``<pre>``/``<textarea>`` contents are left untouched.
+
+    Parameters
+    ----------
+    body : bytes
+        Rendered HTML.
+
+    Returns
+    -------
+    bytes
+        The minified HTML.
+    """
+    return _HTML_WHITESPACE_RE.sub(lambda m: m.group(1) or b"\n", body)
+
+
+def json_response(request: Request, payload: tuple[bytes, str]) -> Response:
+    """
+    Serve a pre-serialized JSON payload with HTTP caching headers.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request.
+    payload : tuple of (bytes, str)
+        JSON body and ETag, as returned by ``json_payload``.
+
+    Returns
+    -------
+    fastapi.responses.Response
+        The JSON body, or an empty 304 response when the client's copy is
+        current.
+    """
+    body, etag = payload
+    headers = {"ETag": etag, "Cache-Control": API_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def render_cached(request: Request, name: str, context: dict) -> Response:
+    """
+    Render a static page once per language and serve it from memory.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request.
+    name : str
+        Template name.
+    context : dict
+        Template context, used only when the page is not cached yet.
+
+    Returns
+    -------
+    fastapi.responses.Response
+        The cached HTML (pre-compressed with gzip when the client accepts it)
+        with an ``ETag``, or an empty 304 response when the client's copy is
+        current.
+    """
+    url = request.url
+    key = (url.path, context["lang"], url.scheme, url.netloc)
+    cached = STATIC_HTML.get(key)
+    if cached is None:
+        body = templates.TemplateResponse(
+            request=request, name=name, context=context
+        ).body
+        body = minify_html(body)
+        digest = content_digest(body)
+        cached = (body, gzip.compress(body, compresslevel=9, mtime=0), digest)
+        if not DEV:
+            STATIC_HTML[key] = cached
+            if len(STATIC_HTML) > STATIC_HTML_MAX_ENTRIES:
+                STATIC_HTML.popitem(last=False)
+    else:
+        STATIC_HTML.move_to_end(key)
+    body, body_gz, digest = cached
+    headers = {
+        "Cache-Control": PAGE_CACHE_CONTROL,
+        "Vary": "Cookie, Accept-Language, Accept-Encoding",
+    }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = body_gz
+        headers["Content-Encoding"] = "gzip"
+        headers["ETag"] = f'"{digest}-gz"'
+    else:
+        headers["ETag"] = f'"{digest}"'
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
+
+
+# Plain ASCII addresses (nearly every submission) are accepted by this
+# precompiled pattern; anything else, including addresses at special-use
+# domains (.local, .test, ...) and labels with "--" in third and fourth
+# position (reserved for IDNA "xn--"), falls back to email-validator's full
+# RFC parsing.
+EMAIL_RE = re.compile(
+    r"(?!\.)(?!.*\.\.)[A-Za-z0-9._%+-]{1,64}(?<!\.)@"
+    r"(?:(?![A-Za-z0-9-]{2}--)[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+"
+    r"[A-Za-z]{2,24}"
+)
+# Length limits enforced by email-validator (RFC 3696 errata and RFC 1035).
+EMAIL_MAX_LENGTH = 254
+DOMAIN_MAX_LENGTH = 253
+
+
+def is_valid_email(address: str) -> bool:
+    """
+    Check that a submitted email address is syntactically valid.
+
+    Parameters
+    ----------
+    address : str
+        The address to check.
+
+    Returns
+    -------
+    bool
+        True if the address is valid.
+    """
+    domain = address.rpartition("@")[2].lower()
+    if (
+        len(address) <= EMAIL_MAX_LENGTH
+        and len(domain) <= DOMAIN_MAX_LENGTH
+        and EMAIL_RE.fullmatch(address)
+    ):
+        if not any(
+            domain == name or domain.endswith("." + name)
+            for name in SPECIAL_USE_DOMAIN_NAMES
+        ):
+            return True
+    try:
+        validate_email(address, check_deliverability=False)
+    except EmailNotValidError:
+        return False
+    return True
+
+
+class FormSubmission(BaseModel):
+    """Base model for public form payloads: bounded, trimmed, no extra keys."""
+
+    model_config = ConfigDict(
+        extra="forbid", str_strip_whitespace=True, str_max_length=500, frozen=True
+    )
+
+    # Checkbox values ("on", "true", "1", ...) are coerced to bool by pydantic;
+    # an unchecked box is simply absent from the form, hence the False default.
+    agree_privacy: bool = False
+    agree_coc: bool = False
+
+
+class JoinRequest(FormSubmission):
     full_name: str
     email: str
-    city: Optional[str] = None
-    level: Optional[str] = None
-    agree_privacy: bool
-    agree_coc: bool
+    city: str | None = None
+    level: str | None = None
 
 
-class PartnershipRequest(BaseModel):
+class PartnershipRequest(FormSubmission):
     organization: str
     contact_name: str
     email: str
-    website: Optional[str] = None
-    message: Optional[str] = None
-    agree_privacy: bool
-    agree_coc: bool
+    website: str | None = None
+    message: str | None = Field(default=None, max_length=5000)
 
 
-class ContactSubmit(BaseModel):
+class ContactSubmit(FormSubmission):
     name: str
     email: str
     subject: str
-    message: str
-    agree_privacy: bool
-    agree_coc: bool
+    message: str = Field(max_length=5000)
+
+
+# One validator per submission model, built once at import.
+FORM_ADAPTERS = {
+    model: TypeAdapter(model)
+    for model in (JoinRequest, PartnershipRequest, ContactSubmit)
+}
 
 
 def get_data(table):
@@ -907,19 +1043,19 @@ def get_data(table):
 
     Returns
     -------
-    list of dict
-        The list of records from the table, or empty list on error.
+    list of dict or None
+        The list of records from the table, or None if the query failed.
     """
     try:
-        response = supabase.table(table).select("*").execute()
+        response = get_supabase().table(table).select("*").execute()
         if hasattr(response, "data"):
             return response.data or []
         elif isinstance(response, dict):
             return response.get("data", []) or []
         return []
-    except Exception as e:
-        print(f"Error fetching data from {table}: {e}")
-        return []
+    except Exception:
+        log.exception("select failed for table=%s", table)
+        return None
 
 
 def insert_data(table, data):
@@ -929,46 +1065,173 @@ def insert_data(table, data):
     ----------
     table : str
         The name of the table to insert into.
-    data : dict
-        The data to insert.
+    data : dict or list of dict
+        The record, or records, to insert.
+
     Returns
     -------
     bool
         True if insertion was successful, False otherwise.
     """
     try:
-        # Accept dict/list or JSON string; ensure we send a list of records
-        payload = data
-        if isinstance(data, str):
-            try:
-                payload = json.loads(data)
-            except Exception:
-                payload = {"payload": data}
-        if isinstance(payload, dict):
-            payload = [payload]
-
-        print(f"Inserting into {table}: {payload}")
-        resp = supabase.table(table).insert(payload[0]).execute()
+        resp = get_supabase().table(table).insert(data).execute()
         err = None
         if hasattr(resp, "error"):
             err = resp.error
         elif isinstance(resp, dict):
             err = resp.get("error")
         if err:
-            print(f"Supabase insert error into {table}: {err}")
+            log.error("insert failed for table=%s: %s", table, err)
             return False
         return True
-    except Exception as e:
-        print(f"Error inserting data into {table}: {e}")
+    except Exception:
+        log.exception("insert failed for table=%s", table)
         return False
 
 
-PARTNERS = get_data("partners")
+# With QUEUE_INSERTS=1, form submissions are answered with 202 as soon as they
+# are queued. A single background worker drains the queue and inserts the rows
+# in one request per table, collecting up to INSERT_BATCH_SIZE rows that
+# arrive within INSERT_BATCH_WAIT seconds of each other. Queued rows only live
+# in memory, so this is off by default: on serverless hosts (e.g. Vercel) the
+# process may be frozen or killed right after the response and lose them.
+INSERT_BATCH_SIZE = 50
+INSERT_BATCH_WAIT = 0.05
+INSERT_QUEUE_SIZE = 10_000
+# Created by start_insert_worker(), so the queue belongs to the running loop.
+_insert_queue: asyncio.Queue[tuple[str, dict]] | None = None
+_insert_worker: asyncio.Task | None = None
+
+
+async def _flush_inserts(items: list[tuple[str, dict]]) -> None:
+    by_table: dict[str, list[dict]] = defaultdict(list)
+    for table, row in items:
+        by_table[table].append(row)
+    for table, rows in by_table.items():
+        if await asyncio.to_thread(insert_data, table, rows):
+            continue
+        # A single bad row fails the whole batch: retry row by row so the
+        # others still get in, and log whatever cannot be stored.
+        for row in rows:
+            if len(rows) == 1 or not await asyncio.to_thread(insert_data, table, row):
+                log.error("dropped submission for table=%s: %r", table, row)
+
+
+async def _insert_loop(queue: asyncio.Queue[tuple[str, dict]]) -> None:
+    while True:
+        items = [await queue.get()]
+        try:
+            while len(items) < INSERT_BATCH_SIZE:
+                items.append(await asyncio.wait_for(queue.get(), INSERT_BATCH_WAIT))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # Also runs on cancellation, so collected rows are never dropped.
+            await _flush_inserts(items)
+
+
+def _insert_worker_done(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        log.error("insert worker crashed", exc_info=task.exception())
+
+
+def start_insert_worker() -> None:
+    """Start the background worker that batches queued form submissions."""
+    global _insert_queue, _insert_worker
+    if _insert_worker is None:
+        _insert_queue = asyncio.Queue(maxsize=INSERT_QUEUE_SIZE)
+        _insert_worker = asyncio.create_task(_insert_loop(_insert_queue))
+        _insert_worker.add_done_callback(_insert_worker_done)
+
+
+async def stop_insert_worker() -> None:
+    """Stop the insert worker and flush whatever is still queued."""
+    global _insert_queue, _insert_worker
+    if _insert_worker is None:
+        return
+    worker, queue = _insert_worker, _insert_queue
+    # From here on, new submissions are inserted inline.
+    _insert_worker = _insert_queue = None
+    worker.cancel()
+    # A crash has already been logged by _insert_worker_done.
+    await asyncio.gather(worker, return_exceptions=True)
+    pending = []
+    while not queue.empty():
+        pending.append(queue.get_nowait())
+    if pending:
+        await _flush_inserts(pending)
+
+
+# Partners and galleries change rarely. They are fetched on first use, then
+# served from memory and refreshed in the background once older than
+# REMOTE_DATA_TTL seconds (stale-while-revalidate); a failed refresh keeps
+# the last good rows.
+REMOTE_DATA_TTL = 300
+REMOTE_TABLES = ("partners", "galleries")
+# table -> (time.monotonic() of the last fetch attempt, last good rows)
+_remote_data: dict[str, tuple[float, list[dict]]] = {}
+_remote_refreshes: dict[str, asyncio.Task] = {}
+
+
+async def _refresh_table(table: str) -> None:
+    rows = await asyncio.to_thread(get_data, table)
+    previous = _remote_data.get(table, (0.0, []))[1]
+    if rows is None:
+        rows = previous
+    elif rows != previous:
+        # Cached pages embed this data.
+        STATIC_HTML.clear()
+    _remote_data[table] = (time.monotonic(), rows)
+
+
+def schedule_refresh(table: str) -> asyncio.Task:
+    """
+    Start refreshing a remote table in the background, once at a time.
+
+    Parameters
+    ----------
+    table : str
+        The Supabase table name.
+
+    Returns
+    -------
+    asyncio.Task
+        The running refresh task.
+    """
+    task = _remote_refreshes.get(table)
+    if task is None:
+        task = asyncio.create_task(_refresh_table(table))
+        _remote_refreshes[table] = task
+        task.add_done_callback(lambda _: _remote_refreshes.pop(table, None))
+    return task
+
+
+async def get_table(table: str) -> list[dict]:
+    """
+    Return the cached rows of a remote table.
+
+    Parameters
+    ----------
+    table : str
+        The Supabase table name.
+
+    Returns
+    -------
+    list of dict
+        The rows. Only the very first call waits for Supabase; later calls
+        return immediately, triggering a background refresh when stale.
+    """
+    entry = _remote_data.get(table)
+    if entry is None:
+        await asyncio.shield(schedule_refresh(table))
+        entry = _remote_data[table]
+    elif time.monotonic() - entry[0] > REMOTE_DATA_TTL:
+        schedule_refresh(table)
+    return entry[1]
 
-GALLERIES = get_data("galleries")
 
-JOIN_REQUESTS: List[dict] = []
-CONTACT_MESSAGES: List[dict] = []
+JOIN_REQUESTS: list[dict] = []
+CONTACT_MESSAGES: list[dict] = []
 
 
 # Template routes
@@ -1000,32 +1263,16 @@ async def home(request: Request):
     Access via browser: ``GET /``
     """
     lang = get_language(request)
-    news_items = []
-    for n in SAMPLE_NEWS:
-        tr = n.get("translations", {}).get(lang, {})
-        img = n.get("image") or f"https://picsum.photos/seed/news-{n['id']}/600/340"
-        news_items.append(
-            {
-                "id": n["id"],
-                "date": n["date"],
-                "title": tr.get("title", ""),
-                "excerpt": tr.get("excerpt", ""),
-                "image": img,
-            }
-        )
-    # show the most recent 2
-    news_items = sorted(news_items, key=lambda x: x["date"], reverse=True)[:2]
-    return templates.TemplateResponse(
+    return render_cached(
         name="home.html",
         request=request,
         context=ctx(
             request,
             {
-                "partners": PARTNERS,
-                "news_home": news_items,
-                "meta_title": TRANSLATIONS[lang]["home-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["footer-about-desc"],
+                "partners": await get_table("partners"),
+                "news_home": HOME_NEWS_BY_LANG[lang],
             },
+            page="home",
         ),
     )
 
@@ -1049,17 +1296,10 @@ async def about(request: Request):
     --------
     ``GET /about``
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         name="about.html",
         request=request,
-        context=ctx(
-            request,
-            {
-                "meta_title": TRANSLATIONS[lang]["about-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["about-blurb"],
-            },
-        ),
+        context=ctx(request, page="about"),
     )
 
 
@@ -1083,29 +1323,15 @@ async def events(request: Request):
     ``GET /events``
     """
     lang = get_language(request)
-    items = []
-    for e in SAMPLE_EVENTS:
-        tr = e.get("translations", {}).get(lang, {})
-        items.append(
-            {
-                "id": e["id"],
-                "date": e["date"],
-                "location": e.get("location", ""),
-                "title": tr.get("title", ""),
-                "description": tr.get("description", ""),
-            }
-        )
-    items = sorted(items, key=lambda x: x["date"], reverse=True)
     return templates.TemplateResponse(
         request=request,
         name="events.html",
         context=ctx(
             request,
             {
-                "events": items,
-                "meta_title": TRANSLATIONS[lang]["events-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["events-sample-desc"],
+                "events": EVENTS_BY_LANG[lang],
             },
+            page="events",
         ),
     )
 
@@ -1132,17 +1358,9 @@ async def event_detail(event_id: int, request: Request):
     ``GET /events/1``
     """
     lang = get_language(request)
-    found = next((e for e in SAMPLE_EVENTS if e["id"] == event_id), None)
-    if not found:
+    item = EVENTS_BY_ID_LANG.get((event_id, lang))
+    if item is None:
         raise HTTPException(status_code=404, detail="Event not found")
-    tr = found.get("translations", {}).get(lang, {})
-    item = {
-        "id": found["id"],
-        "date": found["date"],
-        "location": found.get("location", ""),
-        "title": tr.get("title", ""),
-        "description": tr.get("description", ""),
-    }
     return templates.TemplateResponse(
         request=request,
         name="event_detail.html",
@@ -1177,29 +1395,15 @@ async def actualities(request: Request):
     ``GET /actualities``
     """
     lang = get_language(request)
-    items = []
-    for n in SAMPLE_NEWS:
-        tr = n.get("translations", {}).get(lang, {})
-        img = n.get("image") or f"https://picsum.photos/seed/news-{n['id']}/600/340"
-        items.append(
-            {
-                "id": n["id"],
-                "date": n["date"],
-                "title": tr.get("title", ""),
-                "excerpt": tr.get("excerpt", ""),
-                "image": img,
-            }
-        )
     return templates.TemplateResponse(
         request=request,
         name="actualites.html",
         context=ctx(
             request,
             {
-                "news": items,
-                "meta_title": TRANSLATIONS[lang]["news-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["footer-about-desc"],
+                "news": NEWS_BY_LANG[lang],
             },
+            page="news",
         ),
     )
 
@@ -1226,18 +1430,9 @@ async def news_detail(news_id: int, request: Request):
     ``GET /actualities/2``
     """
     lang = get_language(request)
-    found = next((n for n in SAMPLE_NEWS if n["id"] == news_id), None)
-    if not found:
+    item = NEWS_BY_ID_LANG.get((news_id, lang))
+    if item is None:
         raise HTTPException(status_code=404, detail="News not found")
-    tr = found.get("translations", {}).get(lang, {})
-    item = {
-        "id": found["id"],
-        "date": found["date"],
-        "title": tr.get("title", ""),
-        "body": tr.get("body", ""),
-        "image": found.get("image")
-        or f"https://picsum.photos/seed/news-{found['id']}/1200/680",
-    }
     return templates.TemplateResponse(
         request=request,
         name="news_detail.html",
@@ -1268,17 +1463,15 @@ async def partners(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="partners.html",
         context=ctx(
             request,
             {
-                "partners": PARTNERS,
-                "meta_title": TRANSLATIONS[lang]["nav-partners"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["partners-intro"],
+                "partners": await get_table("partners"),
             },
+            page="partners",
         ),
     )
 
@@ -1298,17 +1491,10 @@ async def communities(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="communities.html",
-        context=ctx(
-            request,
-            {
-                "meta_title": TRANSLATIONS[lang]["nav-communities"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["communities-card-desc"],
-            },
-        ),
+        context=ctx(request, page="communities"),
     )
 
 
@@ -1327,17 +1513,10 @@ async def join(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="join.html",
-        context=ctx(
-            request,
-            {
-                "meta_title": TRANSLATIONS[lang]["join-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["join-intro"],
-            },
-        ),
+        context=ctx(request, page="join"),
     )
 
 
@@ -1356,17 +1535,10 @@ async def contact(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="contact.html",
-        context=ctx(
-            request,
-            {
-                "meta_title": TRANSLATIONS[lang]["contact-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["contact-intro"],
-            },
-        ),
+        context=ctx(request, page="contact"),
     )
 
 
@@ -1385,145 +1557,163 @@ async def code_of_conduct(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="code_of_conduct.html",
-        context=ctx(
-            request,
-            {
-                "meta_title": TRANSLATIONS[lang]["coc-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["coc-intro"],
-            },
-        ),
+        context=ctx(request, page="code-of-conduct"),
     )
 
 
-@app.post("/api/v1/partnership")
-async def partnership_submit(request: Request):
+@app.get("/api/v1/events")
+async def api_events(request: Request):
     """
-    Receive partnership form submissions as JSON.
+    Return all events as JSON.
 
     Parameters
     ----------
     request : fastapi.Request
-        The incoming request (JSON or form).
+        The incoming request.
 
     Returns
     -------
-    fastapi.responses.JSONResponse
-        Status indicating receipt of the request.
+    fastapi.responses.Response
+        Pre-serialized JSON list of events with their translations.
     """
-    ct = request.headers.get("content-type", "")
-    if "application/json" in ct:
-        payload = await request.json()
-    else:
-        form = await request.form()
-        payload = dict(form)
+    return json_response(request, _EVENTS_JSON)
 
-    print(f"Partnership payload: {payload}")
 
-    data = PartnershipRequest(**payload)
+@app.get("/api/v1/news")
+async def api_news(request: Request):
+    """
+    Return all news items as JSON.
 
-    print(data)
-    try:
-        validate_email(data.email, check_deliverability=True)
-    except EmailNotValidError:
-        return JSONResponse(
-            status_code=400, content={"error": "Please use a valid email"}
-        )
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request.
 
-    # Normalize boolean fields (coerce possible string values)
-    agree_privacy = getattr(data, "agree_privacy", False) in (
-        True,
-        "true",
-        "True",
-        "on",
-        "1",
-        1,
-    )
-    agree_coc = getattr(data, "agree_coc", False) in (
-        True,
-        "true",
-        "True",
-        "on",
-        "1",
-        1,
-    )
-    if not agree_privacy or not agree_coc:
-        return JSONResponse(status_code=400, content={"error": "consent_required"})
+    Returns
+    -------
+    fastapi.responses.Response
+        Pre-serialized JSON list of news items with their translations.
+    """
+    return json_response(request, _NEWS_JSON)
 
-    inserted = insert_data("partnershiprequest", data.dict())
-    if inserted:
-        return JSONResponse(content={"status": "received"})
-    else:
-        return JSONResponse(content={"status": "Failed"})
 
+@app.get("/api/v1/translations/{lang}")
+async def api_translations(lang: str, request: Request):
+    """
+    Return the UI translation strings for a language as JSON.
 
-@app.post("/api/v1/join")
-async def join_submit(request: Request):
+    Parameters
+    ----------
+    lang : str
+        Language code ("fr" or "en").
+    request : fastapi.Request
+        The incoming request.
+
+    Returns
+    -------
+    fastapi.responses.Response
+        Pre-serialized JSON mapping of translation keys to strings.
     """
-    Receive join form submissions (JSON or form-encoded).
+    payload = _TRANSLATIONS_JSON.get(lang)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Language not supported")
+    return json_response(request, payload)
 
-    Requires consent checkboxes to be set; otherwise returns 400.
+
+def invalid_payload(detail: list) -> ORJSONResponse:
+    """Return the 422 response sent for submissions that cannot be parsed."""
+    return ORJSONResponse(
+        status_code=422, content={"error": "invalid_payload", "detail": detail}
+    )
+
+
+async def _submit(request: Request, model: type[FormSubmission], table: str):
+    """
+    Validate a form submission and store it in a Supabase table.
 
     Parameters
     ----------
     request : fastapi.Request
         The incoming request containing form or JSON payload.
+    model : type of FormSubmission
+        The pydantic model the payload must satisfy.
+    table : str
+        The name of the table to insert into.
 
     Returns
     -------
-    fastapi.responses.JSONResponse
-        Status indicating receipt of the request, or 400 on consent missing.
+    ORJSONResponse
+        The insert status (202 once the row is queued when QUEUE_INSERTS=1),
+        422 on an invalid payload, or 400 on an invalid email or missing
+        consent.
     """
     ct = request.headers.get("content-type", "")
     if "application/json" in ct:
-        payload = await request.json()
+        try:
+            payload = await request.json()
+        except ValueError:  # JSONDecodeError, UnicodeDecodeError
+            return invalid_payload([{"type": "json_invalid", "msg": "Invalid JSON"}])
     else:
-        form = await request.form()
-        payload = dict(form)
-
-    data = JoinRequest(**payload)
+        # FormData is a Mapping: validate it as-is rather than copying to a dict.
+        payload = await request.form()
 
     try:
-        validate_email(data.email, check_deliverability=True)
-    except EmailNotValidError:
-        return JSONResponse(
+        data = FORM_ADAPTERS[model].validate_python(payload)
+    except ValidationError as exc:
+        return invalid_payload(
+            exc.errors(include_url=False, include_context=False, include_input=False)
+        )
+
+    if not is_valid_email(data.email):
+        return ORJSONResponse(
             status_code=400, content={"error": "Please use a valid email"}
         )
 
-    # Normalize boolean fields
-    agree_privacy = getattr(data, "agree_privacy", False) in (
-        True,
-        "true",
-        "True",
-        "on",
-        "1",
-        1,
-    )
-    agree_coc = getattr(data, "agree_coc", False) in (
-        True,
-        "true",
-        "True",
-        "on",
-        "1",
-        1,
-    )
-    if not agree_privacy or not agree_coc:
-        return JSONResponse(status_code=400, content={"error": "consent_required"})
+    if not (data.agree_privacy and data.agree_coc):
+        return ORJSONResponse(status_code=400, content={"error": "consent_required"})
+
+    row = data.model_dump(exclude_none=True)
+    if _insert_worker is not None and not _insert_worker.done():
+        try:
+            _insert_queue.put_nowait((table, row))
+        except asyncio.QueueFull:
+            pass
+        else:
+            return ORJSONResponse(status_code=202, content={"status": "queued"})
 
-    inserted = insert_data("members", data.dict())
+    # Queueing disabled, worker not running or falling behind: insert inline.
+    inserted = await asyncio.to_thread(insert_data, table, row)
     if inserted:
-        return JSONResponse(content={"status": "received"})
+        return ORJSONResponse(content={"status": "received"})
     else:
-        return JSONResponse(content={"status": "Failed"})
+        return ORJSONResponse(content={"status": "Failed"})
 
 
-@app.post("/api/v1/contact")
-async def contact_submit(request: Request):
+@app.post("/api/v1/partnership")
+async def partnership_submit(request: Request):
     """
-    Receive contact form submissions (JSON or form-encoded).
+    Receive partnership form submissions (JSON or form-encoded).
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request containing form or JSON payload.
+
+    Returns
+    -------
+    ORJSONResponse
+        Status indicating receipt of the request.
+    """
+    return await _submit(request, PartnershipRequest, "partnershiprequest")
+
+
+@app.post("/api/v1/join")
+async def join_submit(request: Request):
+    """
+    Receive join form submissions (JSON or form-encoded).
 
     Requires consent checkboxes to be set; otherwise returns 400.
 
@@ -1534,49 +1724,30 @@ async def contact_submit(request: Request):
 
     Returns
     -------
-    fastapi.responses.JSONResponse
-        Status indicating receipt of the message, or 400 on consent missing.
+    ORJSONResponse
+        Status indicating receipt of the request, or 400 on consent missing.
     """
-    ct = request.headers.get("content-type", "")
-    if "application/json" in ct:
-        payload = await request.json()
-    else:
-        form = await request.form()
-        payload = dict(form)
+    return await _submit(request, JoinRequest, "members")
 
-    data = ContactSubmit(**payload)
 
-    try:
-        validate_email(data.email, check_deliverability=True)
-    except EmailNotValidError:
-        return JSONResponse(
-            status_code=400, content={"error": "Please use a valid email"}
-        )
+@app.post("/api/v1/contact")
+async def contact_submit(request: Request):
+    """
+    Receive contact form submissions (JSON or form-encoded).
 
-    agree_privacy = getattr(data, "agree_privacy", False) in (
-        True,
-        "true",
-        "True",
-        "on",
-        "1",
-        1,
-    )
-    agree_coc = getattr(data, "agree_coc", False) in (
-        True,
-        "true",
-        "True",
-        "on",
-        "1",
-        1,
-    )
-    if not agree_privacy or not agree_coc:
-        return JSONResponse(status_code=400, content={"error": "consent_required"})
+    Requires consent checkboxes to be set; otherwise returns 400.
 
-    inserted = insert_data("contacts", data.dict())
-    if inserted:
-        return JSONResponse(content={"status": "received"})
-    else:
-        return JSONResponse(content={"status": "Failed"})
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request containing form or JSON payload.
+
+    Returns
+    -------
+    ORJSONResponse
+        Status indicating receipt of the message, or 400 on consent missing.
+    """
+    return await _submit(request, ContactSubmit, "contacts")
 
 
 @app.get("/gallery")
@@ -1594,10 +1765,10 @@ async def gallery(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="gallery.html",
-        context=ctx(request, {"galleries": GALLERIES}),
+        context=ctx(request, {"galleries": await get_table("galleries")}),
     )
 
 
@@ -1616,17 +1787,10 @@ async def privacy(request: Request):
     fastapi.responses.HTMLResponse
         Rendered template response.
     """
-    lang = get_language(request)
-    return templates.TemplateResponse(
+    return render_cached(
         request=request,
         name="privacy.html",
-        context=ctx(
-            request,
-            {
-                "meta_title": TRANSLATIONS[lang]["privacy-title"] + " — Python Togo",
-                "meta_description": TRANSLATIONS[lang]["privacy-intro"],
-            },
-        ),
+        context=ctx(request, page="privacy"),
     )
 
 
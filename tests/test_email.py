@@ -0,0 +1,87 @@
+import random
+import string
+
+from email_validator import EmailNotValidError, validate_email
+import pytest
+
+from main import is_valid_email
+
+
+def reference(address: str) -> bool:
+    try:
+        validate_email(address, check_deliverability=False)
+    except EmailNotValidError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "contact@pytogo.org",
+        "first.last+tag@example.com",
+        "a_b-c%d@sub.domain.co.uk",
+        "x@foo.localhost.com",
+    ],
+)
+def test_accepts_plain_addresses(address):
+    assert is_valid_email(address)
+    assert reference(address)
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "x@foo.local",
+        "x@example.test",
+        "x@foo.invalid",
+        "x@a.localhost",
+        "x@ex.onion",
+        "x@ex.arpa",
+        "X@Foo.LOCAL",
+        "x@home.arpa",
+    ],
+)
+def test_rejects_special_use_domains(address):
+    assert not is_valid_email(address)
+    assert not reference(address)
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "",
+        "no-at-sign",
+        "@example.com",
+        "x@",
+        ".x@example.com",
+        "x.@example.com",
+        "x..y@example.com",
+        "x@-example.com",
+        "x@example",
+        "a@b.co\n",
+        # 260 characters, over the 254 limit.
+        "a" * 64 + "@" + "b" * 63 + "." + "c" * 63 + "." + "d" * 63 + ".com",
+        # 325-character domain, over the 253 limit.
+        "x@" + ".".join(["a" * 63] * 5) + ".com",
+        "x@ab--cd.com",
+    ],
+)
+def test_rejects_malformed_addresses(address):
+    assert not is_valid_email(address)
+    assert not reference(address)
+
+
+def test_agrees_with_email_validator():
+    rng = random.Random(0)
+    local_chars = string.ascii_letters + string.digits + "._%+-"
+    label_chars = string.ascii_lowercase + string.digits + "-"
+    for _ in range(2000):
+        local = "".join(rng.choices(local_chars, k=rng.randint(1, 66)))
+        labels = [
+            "".join(rng.choices(label_chars, k=rng.randint(1, 64)))
+            for _ in range(rng.randint(1, 5))
+        ]
+        tld = rng.choice(["com", "org", "io", "local", "test", "c0m", "x", ""])
+        address = local + "@" + ".".join([*labels, tld])
+        assert is_valid_email(address) == reference(address), address
@@ -0,0 +1,95 @@
+import asyncio
+from collections import OrderedDict
+
+from fastapi.testclient import TestClient
+import pytest
+
+import main
+
+pytestmark = pytest.mark.skipif(main.DEV, reason="pages are not cached under DEV=1")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "STATIC_HTML", OrderedDict())
+    return TestClient(main.app)
+
+
+def test_etag_and_not_modified(client):
+    plain = client.get("/about", headers={"accept-encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    digest = main.content_digest(plain.content)
+    assert plain.headers["etag"] == f'"{digest}"'
+
+    gz = client.get("/about", headers={"accept-encoding": "gzip"})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.headers["etag"] == f'"{digest}-gz"'
+    assert gz.content == plain.content
+
+    resp = client.get(
+        "/about",
+        headers={"accept-encoding": "gzip", "if-none-match": gz.headers["etag"]},
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == gz.headers["etag"]
+
+    # The plain ETag does not validate the gzip representation.
+    resp = client.get(
+        "/about",
+        headers={"accept-encoding": "gzip", "if-none-match": plain.headers["etag"]},
+    )
+    assert resp.status_code == 200
+
+
+def test_cache_headers(client):
+    resp = client.get("/about?lang=en")
+    assert resp.headers["vary"] == "Cookie, Accept-Language, Accept-Encoding"
+    assert resp.headers["cache-control"] == "public, max-age=300"
+    assert "set-cookie" not in resp.headers
+
+
+def test_pages_are_cached_per_language(client):
+    fr = client.get("/about", headers={"accept-language": "fr"})
+    en = client.get("/about", headers={"accept-language": "en"})
+    assert fr.content != en.content
+    assert set(main.STATIC_HTML) == {
+        ("/about", "fr", "http", "testserver"),
+        ("/about", "en", "http", "testserver"),
+    }
+
+
+def test_lru_eviction_of_unknown_hosts(client, monkeypatch):
+    monkeypatch.setattr(main, "STATIC_HTML_MAX_ENTRIES", 4)
+    real = ("/about", "fr", "http", "testserver")
+    client.get("/about")
+    for i in range(10):
+        client.get("/about", headers={"host": f"spam{i}.example"})
+        # The real host keeps being used, so it is never the oldest entry.
+        client.get("/about")
+    assert len(main.STATIC_HTML) == 4
+    assert real in main.STATIC_HTML
+    hosts = [key[3] for key in main.STATIC_HTML if key != real]
+    assert hosts == ["spam7.example", "spam8.example", "spam9.example"]
+
+
+@pytest.mark.parametrize(
+    ("fetched", "cleared"),
+    [
+        ([{"name": "New partner"}], True),
+        ([{"name": "Old partner"}], False),
+        (None, False),  # a failed fetch keeps the last good rows
+    ],
+)
+def test_refresh_clears_pages_when_rows_change(client, monkeypatch, fetched, cleared):
+    old_rows = [{"name": "Old partner"}]
+    monkeypatch.setattr(main, "_remote_data", {"partners": (0.0, old_rows)})
+    monkeypatch.setattr(main, "get_data", lambda table: fetched)
+    client.get("/about")
+    assert main.STATIC_HTML
+
+    asyncio.run(main._refresh_table("partners"))
+
+    assert (not main.STATIC_HTML) is cleared
+    assert main._remote_data["partners"][1] == (fetched or old_rows)
@@ -0,0 +1,72 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+import main
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def make_client(tmp_path, **kwargs):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text("body { color: black; }")
+    files = main.CachedStaticFiles(directory=tmp_path, **kwargs)
+    app = FastAPI()
+    app.mount("/static", files, name="static")
+    return TestClient(app), files
+
+
+def test_second_get_is_served_from_memory(tmp_path):
+    client, files = make_client(tmp_path)
+    first = client.get("/static/css/site.css")
+    assert first.status_code == 200
+    assert "css/site.css" in files._cache
+
+    # Same length, so only a fresh read from disk would show the change.
+    (tmp_path / "css" / "site.css").write_text("body { color: orange;}")
+    second = client.get("/static/css/site.css")
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["content-type"] == first.headers["content-type"]
+
+
+def test_not_modified_on_cache_hit(tmp_path):
+    client, files = make_client(tmp_path)
+    etag = client.get("/static/css/site.css").headers["etag"]
+    assert "css/site.css" in files._cache
+    resp = client.get("/static/css/site.css", headers={"if-none-match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["cache-control"] == "public, max-age=300"
+
+
+@pytest.mark.parametrize(
+    ("query", "cache_control"),
+    [
+        ("?v=abc123", IMMUTABLE),
+        ("?v=stale", "public, max-age=300"),
+        ("", "public, max-age=300"),
+    ],
+)
+def test_immutable_only_for_current_version(tmp_path, query, cache_control):
+    client, _ = make_client(tmp_path, versions={"css/site.css": "abc123"})
+    # First response comes from disk, the second one from memory.
+    for _ in range(2):
+        resp = client.get(f"/static/css/site.css{query}")
+        assert resp.headers["cache-control"] == cache_control
+
+
+def test_max_entries_zero_disables_cache(tmp_path):
+    client, files = make_client(tmp_path, max_entries=0)
+    client.get("/static/css/site.css")
+    (tmp_path / "css" / "site.css").write_text("body { color: orange;}")
+    resp = client.get("/static/css/site.css")
+    assert resp.text == "body { color: orange;}"
+    assert not files._cache
+
+
+@pytest.mark.skipif(main.DEV, reason="assets are not fingerprinted under DEV=1")
+def test_fingerprinted_site_assets_are_immutable():
+    url = main.static_url("css/style.css")
+    assert url == f"/static/css/style.css?v={main.STATIC_VERSIONS['css/style.css']}"
+    resp = TestClient(main.app).get(url)
+    assert resp.headers["cache-control"] == IMMUTABLE
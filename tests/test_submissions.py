@@ -0,0 +1,101 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+import pytest
+
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    inserted = []
+    monkeypatch.setattr(
+        main, "insert_data", lambda table, data: inserted.append((table, data)) or True
+    )
+    client = TestClient(main.app)
+    client.inserted = inserted
+    return client
+
+
+@pytest.mark.parametrize(
+    "url", ["/api/v1/join", "/api/v1/contact", "/api/v1/partnership"]
+)
+@pytest.mark.parametrize("body", [b"{not json", b"\xff\xfe", b""])
+def test_malformed_json_is_rejected(client, url, body):
+    resp = client.post(url, content=body, headers={"content-type": "application/json"})
+    assert resp.status_code == 422
+    assert resp.json()["error"] == "invalid_payload"
+    assert client.inserted == []
+
+
+def test_invalid_fields_are_rejected(client):
+    resp = client.post("/api/v1/join", json={"email": "a@example.com"})
+    assert resp.status_code == 422
+    assert resp.json()["error"] == "invalid_payload"
+    assert client.inserted == []
+
+
+def test_valid_form_is_inserted(client):
+    resp = client.post(
+        "/api/v1/join",
+        data={
+            "full_name": "Ama",
+            "email": "ama@example.com",
+            "agree_privacy": "on",
+            "agree_coc": "on",
+        },
+    )
+    assert resp.status_code == 200
+    assert client.inserted == [
+        (
+            "members",
+            {
+                "agree_privacy": True,
+                "agree_coc": True,
+                "full_name": "Ama",
+                "email": "ama@example.com",
+            },
+        )
+    ]
+
+
+JOIN = {
+    "full_name": "Ama",
+    "email": "ama@example.com",
+    "agree_privacy": True,
+    "agree_coc": True,
+}
+
+
+def test_queued_inserts_survive_several_lifespans(client, monkeypatch):
+    monkeypatch.setattr(main, "QUEUE_INSERTS", True)
+    monkeypatch.setattr(main, "get_data", lambda table: [])
+    for _ in range(2):
+        with client:
+            resp = client.post("/api/v1/join", json=JOIN)
+            assert resp.status_code == 202
+    rows = [row for _, batch in client.inserted for row in batch]
+    assert len(rows) == 2
+    assert main._insert_worker is None
+
+
+def test_failed_batch_is_retried_row_by_row(monkeypatch, caplog):
+    stored = []
+
+    def insert_data(table, data):
+        if isinstance(data, list):
+            return False
+        if data["email"] == "bad@example.com":
+            return False
+        stored.append(data)
+        return True
+
+    monkeypatch.setattr(main, "insert_data", insert_data)
+    items = [
+        ("members", {"email": "a@example.com"}),
+        ("members", {"email": "bad@example.com"}),
+        ("members", {"email": "b@example.com"}),
+    ]
+    asyncio.run(main._flush_inserts(items))
+    assert stored == [{"email": "a@example.com"}, {"email": "b@example.com"}]
+    assert "bad@example.com" in caplog.text